@@ -0,0 +1,21 @@
+"""
+Catalogue de ressources généré — NE PAS ÉDITER À LA MAIN.
+Régénérer avec : python3 scripts/gen_resources.py
+"""
+
+# (title, category, description, difficulty, duration_minutes, tags)
+RESOURCES = {
+    'malware_tmp_execution': ('Pourquoi les exécutables dans /tmp sont dangereux', 'malware', "Comprendre les risques d'exécution depuis /tmp", 'beginner', 5, frozenset(('filesystem', 'linux', 'malware', 'permissions'))),
+    'network_suspicious_ip': ('Détecter les connexions vers des serveurs malveillants', 'network', 'Identifier C&C et les serveurs de commande malveillants', 'intermediate', 8, frozenset(('botnet', 'c2', 'detection', 'network'))),
+    'privilege_escalation': ("L'escalade de privilèges : Comment les attaquants deviennent administrateur", 'privilege', "Comprendre et prévenir l'escalade de privilèges", 'advanced', 10, frozenset(('kernel', 'privilege', 'sudo', 'suid', 'vulnerability'))),
+    'unsigned_binary': ("Binaires non signés : Vérifier l'authenticité des programmes", 'file', 'Pourquoi les signatures numériques sont importantes', 'beginner', 6, frozenset(('authentication', 'code-signing', 'integrity', 'signature'))),
+    'process_monitoring': ('Monitoring des processus : Votre première ligne de défense', 'process', 'Comment surveiller les processus pour détecter les anomalies', 'intermediate', 9, frozenset(('anomaly', 'detection', 'monitoring', 'process'))),
+    'injection_attack': ('Attaques par Injection : SQL, Command, Code', 'malware', 'Comprendre les attaques par injection et leurs variantes', 'intermediate', 12, frozenset(('code', 'command', 'injection', 'sql', 'vulnerability'))),
+    'malware_types': ('Types de Malwares : Virus, Worms, Trojans, Ransomware', 'malware', 'Classification et caractéristiques des différents types de malwares', 'intermediate', 14, frozenset(('malware', 'ransomware', 'trojan', 'virus', 'worm'))),
+    'phishing_social_eng': ("Phishing et Ingénierie Sociale : Manipuler l'Utilisateur", 'malware', 'Comment les attaquants trompent les humains pour accéder aux systèmes', 'beginner', 11, frozenset(('email', 'phishing', 'scam', 'social-engineering'))),
+    'password_security': ('Sécurité des Mots de Passe : Créer et Protéger', 'file', 'Bonnes pratiques pour des mots de passe forts et uniques', 'beginner', 10, frozenset(('2fa', 'authentication', 'password', 'security'))),
+    'firewall_basics': ('Firewall 101 : Votre Première Barrière', 'network', 'Comprendre les pare-feu et la protection réseau de base', 'beginner', 13, frozenset(('defense', 'firewall', 'network', 'rules'))),
+    'encryption_basics': ('Chiffrement : Protéger Vos Données', 'file', 'Comprendre le chiffrement et le déchiffrement des données', 'intermediate', 15, frozenset(('aes', 'cryptography', 'encryption', 'https', 'rsa'))),
+    'zero_trust_security': ('Zero Trust : Ne Faire Confiance à Personne', 'network', 'Architecture de sécurité moderne basée sur la vérification continue', 'advanced', 16, frozenset(('defense', 'mfa', 'security-architecture', 'zero-trust'))),
+    'incident_response': ("Répondre à une Cyberattaque : Plan d'Action", 'process', 'Procédure étape par étape pour gérer une incident de sécurité', 'advanced', 18, frozenset(('crisis', 'forensics', 'incident-response', 'recovery'))),
+}
@@ -9,26 +9,29 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import sys
 import threading
 import time
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, fields, is_dataclass
 from datetime import datetime
 from typing import Any, Dict, List
 
 # Import modular views moved to `vue/` package
 try:
-    from vue.dashboard import get_dashboard_view
+    from vue.dashboard import get_dashboard_view, render_process_rows
     from vue.network import get_network_view
     from vue.learning import get_learning_view
-    from vue.infos import get_infos_view
+    from vue.infos import get_infos_view, get_infos_css_view
 except Exception:
     # If views package isn't available yet, set placeholders
     get_dashboard_view = None
+    render_process_rows = None
     get_network_view = None
     get_learning_view = None
     get_infos_view = None
+    get_infos_css_view = None
 
 try:
     from flask import Flask, render_template_string, jsonify, request
@@ -48,32 +51,78 @@ engine = None
 try:
     from scanner_processus.liste_processus import ProcessLister
     from scanner_processus.collecteur_systeme import SystemInfoCollector
+    from scanner_processus.moniteur_ressource import CpuSampler
     from learning_module import LearningModule
 except Exception:
     ProcessLister = None
     SystemInfoCollector = None
+    CpuSampler = None
     LearningModule = None
 
 
+@functools.cache
+def _dataclass_field_names(cls) -> tuple:
+    """Noms de champs d'une dataclass, calculés une fois par classe."""
+    return tuple(f.name for f in fields(cls))
+
+
 def _to_serializable(obj: Any):
-    """Convertit dataclasses / nested structures en objets sérialisables JSON."""
-    if is_dataclass(obj):
-        return asdict(obj)
-    if isinstance(obj, dict):
-        return {k: _to_serializable(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [_to_serializable(x) for x in obj]
-    return obj
+    """
+    Convertit dataclasses / nested structures en objets sérialisables JSON.
+    Parcours itératif (pile explicite) : pas de frame Python par nœud ni
+    de limite de récursion sur les structures profondes.
+    """
+    root = [obj]
+    stack = [(root, 0, obj)]
+    while stack:
+        container, key, value = stack.pop()
+        t = type(value)
+        if is_dataclass(value) and not isinstance(value, type):
+            value = {name: getattr(value, name) for name in _dataclass_field_names(t)}
+            t = dict
+        if t is dict:
+            new: Any = {}
+            container[key] = new
+            for k, v in value.items():
+                stack.append((new, k, v))
+        elif t is list or t is tuple:
+            new = [None] * len(value)
+            container[key] = new
+            for i, v in enumerate(value):
+                stack.append((new, i, v))
+        elif t is set or t is frozenset:
+            # Ordre trié pour un JSON déterministe
+            new = [None] * len(value)
+            container[key] = new
+            for i, v in enumerate(sorted(value, key=repr)):
+                stack.append((new, i, v))
+        else:
+            container[key] = value
+    return root[0]
 
 
 class AnalysisEngine:
     """Simple engine that aggregates system info, processes and learning module."""
 
+    # Rétention des tombstones de suppression, en nombre de ticks : large
+    # devant la cadence de polling du dashboard (2 s), négligeable en mémoire.
+    _TOMBSTONE_HORIZON = 512
+
     def __init__(self, limit: int = 20):
         self.limit = limit
         self.process_lister = ProcessLister() if ProcessLister else None
         self.system_collector = SystemInfoCollector() if SystemInfoCollector else None
+        self.cpu_sampler = CpuSampler() if CpuSampler else None
         self.learning = LearningModule() if LearningModule else None
+        # État pour l'endpoint delta (/api/processes?since=N)
+        self._seq = 0
+        self._snapshot: Dict[int, Dict[str, Any]] = {}
+        self._row_seq: Dict[int, int] = {}
+        # Tombstones pid -> séquence de disparition : une suppression doit
+        # rester visible pour tout client dont le `since` lui est antérieur,
+        # pas seulement celui dont la requête consomme le tick.
+        self._removed_seq: Dict[int, int] = {}
+        self._delta_lock = threading.Lock()
 
     def get_system_info(self) -> Dict[str, Any]:
         if self.system_collector:
@@ -93,8 +142,71 @@ class AnalysisEngine:
                 result.append(_to_serializable(p))
             except Exception:
                 result.append({"pid": getattr(p, 'pid', None), "name": getattr(p, 'name', None)})
+
+        # CPU% par processus dérivé d'un seul échantillon par tick
+        # (un delta partagé au lieu d'un cpu_percent bloquant par processus)
+        if self.cpu_sampler:
+            try:
+                cpu_by_pid = self.cpu_sampler.sample(r["pid"] for r in result if r.get("pid"))
+                for r in result:
+                    r["cpu_percent"] = cpu_by_pid.get(r.get("pid"), 0.0)
+            except Exception:
+                pass
         return result
 
+    def diff_processes(self, since: int, limit: int | None = None) -> Dict[str, Any]:
+        """
+        Scanne les processus et retourne uniquement les lignes modifiées
+        depuis la séquence `since` : {"seq": N, "added": [...], "changed":
+        [...], "removed": [pid, ...]}. Un client à jour reçoit un payload
+        quasi vide au lieu de re-télécharger toutes les lignes.
+        """
+        rows = self.analyze_processes(limit=self.limit if limit is None else limit)
+        with self._delta_lock:
+            self._seq += 1
+            seq = self._seq
+            current: Dict[int, Dict[str, Any]] = {}
+            added: List[Dict[str, Any]] = []
+            changed: List[Dict[str, Any]] = []
+            for row in rows:
+                pid = row.get("pid")
+                if pid is None:
+                    continue
+                current[pid] = row
+                prev = self._snapshot.get(pid)
+                if prev is None:
+                    self._row_seq[pid] = seq
+                    # Un PID recyclé ou réapparu annule sa tombstone : le
+                    # client ne doit pas recevoir added et removed à la fois.
+                    self._removed_seq.pop(pid, None)
+                    added.append(row)
+                elif prev != row:
+                    self._row_seq[pid] = seq
+                    changed.append(row)
+                elif self._row_seq.get(pid, 0) > since:
+                    # Modifiée après `since` mais pas pendant ce tick :
+                    # le client en retard doit quand même la recevoir.
+                    changed.append(row)
+            for pid in self._snapshot:
+                if pid not in current:
+                    self._row_seq.pop(pid, None)
+                    self._removed_seq[pid] = seq
+            # Même mécanisme que _row_seq pour les lignes modifiées : toute
+            # disparition postérieure à `since` est rejouée au client.
+            removed = [pid for pid, rseq in self._removed_seq.items()
+                       if rseq > since]
+            # Purge au-delà d'un horizon fixe, pour borner la mémoire : un
+            # client plus en retard que ça repart d'un since=0 (resynchro
+            # complète) et n'a pas besoin des suppressions individuelles.
+            horizon = seq - self._TOMBSTONE_HORIZON
+            if horizon > 0:
+                stale = [pid for pid, rseq in self._removed_seq.items()
+                         if rseq <= horizon]
+                for pid in stale:
+                    del self._removed_seq[pid]
+            self._snapshot = current
+            return {"seq": seq, "added": added, "changed": changed, "removed": removed}
+
     def get_analysis(self) -> Dict[str, Any]:
         return {
             "timestamp": datetime.now().isoformat(),
@@ -156,8 +268,11 @@ def api_system():
 
 @app.route("/api/processes", methods=["GET"])
 def api_processes():
-    """Processus uniquement."""
+    """Processus uniquement. Avec ?since=N, retourne un delta incrémental."""
     if engine:
+        since = request.args.get("since", type=int)
+        if since is not None:
+            return jsonify(engine.diff_processes(since))
         try:
             q = request.args.get("limit")
             if q is not None:
@@ -171,13 +286,27 @@ def api_processes():
     return jsonify({"error": "Engine not initialized"}), 500
 
 
+@app.route("/api/processes.html", methods=["GET"])
+def api_processes_html():
+    """Lignes de la table de processus pré-rendues côté serveur (fragment HTML)."""
+    if engine and render_process_rows:
+        return render_process_rows(engine.analyze_processes(limit=engine.limit))
+    return "<tr><td colspan=\"7\">Engine not initialized</td></tr>", 500
+
+
 @app.route("/api/alerts", methods=["GET"])
 def api_alerts():
     """Récupère les alertes de sécurité récentes."""
     if engine and engine.learning:
         limit = request.args.get("limit", default=20, type=int)
         alerts = engine.learning.get_recent_alerts(limit)
-        return jsonify(_to_serializable(alerts))
+        data = _to_serializable(alerts)
+        # timestamp/last_seen sont des propriétés (époque µs formatée en
+        # ISO à l'affichage), pas des champs : les réinjecter dans le JSON.
+        for item, alert in zip(data, alerts):
+            item["timestamp"] = alert.timestamp
+            item["last_seen"] = alert.last_seen
+        return jsonify(data)
     return jsonify({"error": "Learning module not initialized"}), 500
 
 
@@ -187,7 +316,10 @@ def api_alert_detail(alert_id):
     if engine and engine.learning:
         alert = engine.learning.get_alert(alert_id)
         if alert:
-            return jsonify(_to_serializable(alert))
+            data = _to_serializable(alert)
+            data["timestamp"] = alert.timestamp
+            data["last_seen"] = alert.last_seen
+            return jsonify(data)
         return jsonify({"error": "Alert not found"}), 404
     return jsonify({"error": "Learning module not initialized"}), 500
 
@@ -204,9 +336,23 @@ def api_learning_resources():
         elif difficulty:
             resources = engine.learning.get_learning_resources_by_difficulty(difficulty)
         else:
-            resources = engine.learning.get_all_learning_resources()
-        
-        return jsonify(_to_serializable(resources))
+            # Catalogue complet : blob JSON pré-sérialisé (et pré-compressé),
+            # servi tel quel — même schéma que la vue infos statique
+            if "gzip" in request.accept_encodings:
+                return app.response_class(
+                    engine.learning.resources_json_gzip(),
+                    mimetype="application/json",
+                    headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+                )
+            return app.response_class(engine.learning.resources_json(),
+                                      mimetype="application/json")
+
+        data = _to_serializable(resources)
+        # `content` est une propriété paresseuse (HTML décompressé à la
+        # demande), pas un champ de dataclass : le réinjecter dans le JSON.
+        for item, resource in zip(data, resources):
+            item["content"] = resource.content
+        return jsonify(data)
     return jsonify({"error": "Learning module not initialized"}), 500
 
 
@@ -214,9 +360,11 @@ def api_learning_resources():
 def api_learning_resource_detail(resource_id):
     """Récupère les détails d'une ressource d'apprentissage."""
     if engine and engine.learning:
-        resource = engine.learning.get_learning_resource(resource_id)
-        if resource:
-            return jsonify(_to_serializable(resource))
+        # Fiche pré-sérialisée (contenu compris) : le gros HTML ne repasse
+        # pas par json.dumps à chaque consultation.
+        blob = engine.learning.resource_json(resource_id)
+        if blob is not None:
+            return app.response_class(blob, mimetype="application/json")
         return jsonify({"error": "Resource not found"}), 404
     return jsonify({"error": "Learning module not initialized"}), 500
 
@@ -237,6 +385,14 @@ def infos():
     return "<h1>Page Infos indisponible</h1>", 404
 
 
+@app.route("/static/infos.css", methods=["GET"])
+def infos_css():
+    """Feuille de style de la page infos (asset statique pré-compressé)."""
+    if get_infos_css_view:
+        return get_infos_css_view()
+    return "", 404
+
+
 @app.route("/health", methods=["GET"])
 def health():
     """Health check."""
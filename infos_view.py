@@ -3,13 +3,13 @@ Vue Infos - Page d'information et glossaire Learn-Protect
 Contient le template HTML pour la page /infos
 """
 
-INFOS_HTML = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>Learn-Protect - Infos & Guide</title>
-    <style>
+import gzip
+import hashlib
+
+# CSS découpée en blocs réutilisables (nav/layout, cartes, badges) puis
+# assemblée une fois à l'import : les vues sœurs peuvent partager un bloc
+# sans dupliquer le littéral ni re-gzipper leur propre copie.
+_NAV_CSS = """\
         * { margin: 0; padding: 0; box-sizing: border-box; }
         body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
@@ -39,6 +39,9 @@ INFOS_HTML = """
         }
         .header h1 { font-size: 2.5em; margin-bottom: 10px; color: #00ff88; }
         .header p { font-size: 1.1em; color: #9fb0c8; }
+"""
+
+_CARD_CSS = """\
         .section {
             background: rgba(255,255,255,0.05);
             border: 1px solid rgba(0,255,136,0.15);
@@ -60,6 +63,9 @@ INFOS_HTML = """
         .term-card h3 { color: #7ee787; margin-bottom: 10px; font-size: 1.2em; }
         .term-card .definition { color: #bbb; line-height: 1.6; }
         .term-card .example { margin-top: 10px; padding-top: 10px; border-top: 1px solid rgba(0,255,136,0.1); font-size: 0.9em; color: #999; font-style: italic; }
+"""
+
+_BADGE_CSS = """\
         .feature-list { list-style: none; margin: 15px 0; }
         .feature-list li { padding: 10px 0; padding-left: 30px; position: relative; color: #cfd8df; }
         .feature-list li:before { content: "→"; position: absolute; left: 0; color: #00ff88; font-weight: bold; }
@@ -76,7 +82,18 @@ INFOS_HTML = """
             margin: 15px 0;
             color: #e8d8a0;
         }
-    </style>
+"""
+
+# Feuille complète servie sur /static/infos.css, assemblée une seule fois
+INFOS_CSS = _NAV_CSS + _CARD_CSS + _BADGE_CSS
+
+INFOS_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Learn-Protect - Infos & Guide</title>
+    <link rel="stylesheet" href="/static/infos.css">
 </head>
 <body>
     <nav>
@@ -262,3 +279,14 @@ INFOS_HTML = """
 </body>
 </html>
 """
+
+# Page statique : encodage, compression et ETag calculés une seule fois à
+# l'import, pour que chaque requête serve des bytes prêts à l'emploi.
+INFOS_HTML_BYTES = INFOS_HTML.encode("utf-8")
+INFOS_HTML_LEN = str(len(INFOS_HTML_BYTES))
+INFOS_HTML_GZIP = gzip.compress(INFOS_HTML_BYTES, compresslevel=9)
+INFOS_HTML_ETAG = '"%s"' % hashlib.md5(INFOS_HTML_BYTES).hexdigest()
+
+INFOS_CSS_BYTES = INFOS_CSS.encode("utf-8")
+INFOS_CSS_GZIP = gzip.compress(INFOS_CSS_BYTES, compresslevel=9)
+INFOS_CSS_ETAG = '"%s"' % hashlib.md5(INFOS_CSS_BYTES).hexdigest()
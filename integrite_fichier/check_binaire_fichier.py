@@ -4,17 +4,56 @@ Surveille les fichiers système critiques et les journaux d'événements
 pour détecter des activités suspectes et des anomalies de sécurité.
 """
 
+import atexit
+import functools
+import itertools
 import os
+import queue
+import random
 import sys
 import time
 import logging
+import logging.handlers
 import hashlib
 import json
+import mmap
 from datetime import datetime, timedelta
-from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import threading
 
+# Sérialisation de la baseline : orjson écrit des bytes directement et
+# reste nettement plus rapide que le json stdlib si la baseline grossit.
+# Repli transparent sur la stdlib si orjson n'est pas installé.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Hachage d'intégrité : la baseline est locale et ne sert qu'à détecter
+# des modifications, pas à signer — un hash non cryptographique suffit.
+# xxHash3 est environ un ordre de grandeur plus rapide que SHA-256 ; la
+# vérification devient limitée par les E/S. Repli sur SHA-256 sans xxhash.
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Codec binaire optionnel pour la baseline : si CONFIG['hash_db_file']
+# pointe vers un .msgpack, le chargement est nettement plus rapide que le
+# parse JSON indenté au démarrage. Les baselines .json restent gérées.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# BLAKE3 optionnel : backend SIMD avec parallélisme interne par arbre de
+# chunks — un fichier entier se hache sans aucune boucle Python.
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 # Bibliothèques pour la surveillance des fichiers
 try:
     from watchdog.observers import Observer
@@ -65,10 +104,110 @@ CONFIG = {
     'integrity_check_interval': 300,  # Vérification d'intégrité toutes les 5 minutes
 }
 
-# Compteurs globaux pour la détection d'anomalies
-file_modifications = defaultdict(list)
+# Extensions suspectes en frozenset : test d'appartenance O(1) dans le
+# gestionnaire d'événements, au lieu d'un parcours de liste par événement.
+_SUSPICIOUS_EXTS = frozenset(e.lower() for e in CONFIG['suspicious_extensions'])
+
+# Préfixes des répertoires surveillés, normalisés une fois au chargement.
+# str.startswith accepte un tuple et boucle en C : la classification d'un
+# chemin ne coûte ni itération Python ni lower-casing par événement.
+_TRUSTED_PREFIXES = tuple(os.path.normcase(p) for p in CONFIG['monitored_dirs'])
+
+
+def _check_is_admin():
+    """Sonde les privilèges administrateur, une fois à l'import du module."""
+    if sys.platform.startswith('win'):
+        import ctypes
+        try:
+            return ctypes.windll.shell32.IsUserAnAdmin() != 0
+        except OSError:
+            return False
+    return os.getuid() == 0
+
+
+# Le statut ne change pas pendant la vie du processus : calculé une seule
+# fois, plutôt qu'un try/except AttributeError à chaque initialisation.
+_IS_ADMIN = _check_is_admin()
+
+# Compteurs globaux pour la détection d'anomalies.
+# Deque par fichier : les timestamps sont croissants, donc l'éviction des
+# entrées hors fenêtre se fait par popleft en O(évincées) au lieu de
+# re-filtrer toute la liste à chaque événement. Le maxlen borne la mémoire
+# par fichier bruyant.
+file_modifications = defaultdict(
+    lambda: deque(maxlen=CONFIG['file_change_threshold'] * 4)
+)
 modification_lock = threading.Lock()
 
+# File de coalescence des événements watchdog : Windows peut émettre des
+# dizaines d'événements pour une seule action utilisateur. Les handlers
+# déposent sans verrou, un consommateur draine par lots (~200 Hz) et ne
+# prend modification_lock qu'une fois par lot.
+_event_q = queue.SimpleQueue()
+
+# Templates de messages d'alerte, construits une seule fois au chargement :
+# sur les rafales d'événements, un .format() évite de réassembler les
+# morceaux constants à chaque alerte.
+_TS_FMT = '%Y-%m-%d %H:%M:%S'
+
+
+@functools.lru_cache(maxsize=1)
+def _timestamp_str(second):
+    """Horodatage formaté pour la seconde donnée, mémoïsé : sur une rafale
+    d'alertes, un seul strftime par seconde au lieu d'un datetime + parse
+    du format par alerte."""
+    return time.strftime(_TS_FMT, time.localtime(second))
+
+
+_EXEC_ALERT_TMPL = (
+    "🚨 ALERTE SÉCURITÉ - Fichier exécutable créé dans un emplacement surveillé\n"
+    "   Type: {event_type}\n"
+    "   Fichier: {file_path}\n"
+    "   Extension: {file_ext}\n"
+    "   Gravité: {severity}"
+)
+
+_MOD_RATE_TMPL = (
+    "⚠️  ANOMALIE DÉTECTÉE - Taux de modification élevé\n"
+    "   Fichier: {file_path}\n"
+    "   Modifications: {count} en {window}s\n"
+    "   Gravité: {severity}"
+)
+
+_ALERT_BANNER_TMPL = (
+    "\n" + "=" * 70 + "\n"
+    "ALERTE DE SÉCURITÉ\n"
+    "Horodatage: {timestamp}\n"
+    "Type: {alert_type}\n"
+    "Fichier: {file_path}\n"
+    "Gravité: {severity}\n"
+    "Description: {description}\n"
+    + "=" * 70 + "\n"
+)
+
+_FAILED_LOGINS_TMPL = (
+    "🚨 ALERTE SÉCURITÉ - Tentatives de connexion échouées multiples\n"
+    "   Journal: {log_type}\n"
+    "   Nombre: {count} dans la dernière heure\n"
+    "   Gravité: {severity}\n"
+    "   Recommandation: Vérifier les tentatives d'accès non autorisé"
+)
+
+_ACCESS_DENIED_TMPL = (
+    "⚠️  ANOMALIE - Accès refusés répétés\n"
+    "   Journal: {log_type}\n"
+    "   Nombre: {count} dans la dernière heure\n"
+    "   Gravité: {severity}"
+)
+
+_NEW_SERVICES_TMPL = (
+    "🚨 ALERTE SÉCURITÉ - Création de nouveaux services\n"
+    "   Journal: {log_type}\n"
+    "   Nombre: {count}\n"
+    "   Gravité: {severity}\n"
+    "   Recommandation: Vérifier la légitimité des nouveaux services"
+)
+
 
 def initialize_agent():
     """
@@ -76,12 +215,18 @@ def initialize_agent():
     vérification des permissions, des répertoires surveillés et
     création de la baseline d'intégrité des fichiers.
     """
-    # Configuration du système de logging
+    # Configuration du système de logging. Les alertes arrivent par rafales :
+    # le FileHandler est enveloppé dans un MemoryHandler qui tamponne les
+    # écritures disque (flush immédiat dès le niveau ERROR, ou tampon plein).
+    file_handler = logging.FileHandler(CONFIG['log_file'], encoding='utf-8')
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.ERROR, target=file_handler
+    )
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(CONFIG['log_file'], encoding='utf-8'),
+            buffered_handler,
             logging.StreamHandler()
         ]
     )
@@ -90,14 +235,8 @@ def initialize_agent():
     logging.info("Initialisation de l'Agent de Surveillance de Sécurité Windows")
     logging.info("=" * 70)
 
-    # Vérification des permissions administrateur
-    try:
-        is_admin = os.getuid() == 0
-    except AttributeError:
-        import ctypes
-        is_admin = ctypes.windll.shell32.IsUserAnAdmin() != 0
-
-    if not is_admin:
+    # Vérification des permissions administrateur (sondées à l'import)
+    if not _IS_ADMIN:
         logging.warning("⚠️  L'agent ne s'exécute pas avec des privilèges administrateur.")
         logging.warning("   Certaines fonctionnalités peuvent être limitées.")
 
@@ -115,6 +254,19 @@ def initialize_agent():
     return True
 
 
+def _event_is_relevant(file_path):
+    """
+    Filtre bon marché appliqué avant tout dépôt en file : un événement ne
+    peut déclencher aucune détection si l'extension n'est pas suspecte et
+    que le chemin sort des répertoires surveillés (ex : écritures de cache
+    dans un sous-arbre non suivi). Sortir ici évite la file, le verrou et
+    l'allocation de deque pour le bruit.
+    """
+    if os.path.splitext(file_path)[1].lower() in _SUSPICIOUS_EXTS:
+        return True
+    return os.path.normcase(file_path).startswith(_TRUSTED_PREFIXES)
+
+
 class FileMonitor(FileSystemEventHandler):
     """
     Gestionnaire d'événements pour la surveillance des modifications de fichiers.
@@ -124,74 +276,97 @@ class FileMonitor(FileSystemEventHandler):
     def __init__(self):
         super().__init__()
         self.suspicious_files = []
+        self._consumer = threading.Thread(
+            target=self._consume_events, daemon=True, name='file-event-consumer'
+        )
+        self._consumer.start()
 
     def on_created(self, event):
         """Déclenché lors de la création d'un fichier ou répertoire."""
-        if not event.is_directory:
-            self._handle_file_event("CRÉATION", event.src_path)
+        if not event.is_directory and _event_is_relevant(event.src_path):
+            _event_q.put(("CRÉATION", event.src_path, time.time()))
 
     def on_modified(self, event):
         """Déclenché lors de la modification d'un fichier."""
-        if not event.is_directory:
-            self._handle_file_event("MODIFICATION", event.src_path)
+        if not event.is_directory and _event_is_relevant(event.src_path):
+            _event_q.put(("MODIFICATION", event.src_path, time.time()))
 
     def on_deleted(self, event):
         """Déclenché lors de la suppression d'un fichier ou répertoire."""
-        if not event.is_directory:
-            self._handle_file_event("SUPPRESSION", event.src_path)
+        if not event.is_directory and _event_is_relevant(event.src_path):
+            _event_q.put(("SUPPRESSION", event.src_path, time.time()))
+
+    def _consume_events(self):
+        """Draine la file d'événements par lots et les traite groupés."""
+        while True:
+            time.sleep(0.005)
+            batch = []
+            while True:
+                try:
+                    batch.append(_event_q.get_nowait())
+                except queue.Empty:
+                    break
+            if batch:
+                self._process_batch(batch)
 
-    def _handle_file_event(self, event_type, file_path):
+    def _process_batch(self, batch):
         """
-        Traite les événements de fichiers et détecte les anomalies.
+        Traite un lot d'événements de fichiers et détecte les anomalies.
 
         Args:
-            event_type: Type d'événement (CRÉATION, MODIFICATION, SUPPRESSION)
-            file_path: Chemin complet du fichier concerné
+            batch: Liste de tuples (event_type, file_path, timestamp)
         """
-        current_time = time.time()
-        file_ext = Path(file_path).suffix.lower()
-
-        # Enregistrement de la modification avec timestamp
+        # Mise à jour des compteurs : une seule prise de verrou pour le lot.
+        # Fenêtre et accès au defaultdict liés en locaux hors de la boucle.
+        counts = {}
+        time_window = CONFIG['time_window']
+        get_timestamps = file_modifications.__getitem__
         with modification_lock:
-            file_modifications[file_path].append(current_time)
-
-            # Nettoyage des anciennes entrées (hors fenêtre temporelle)
-            file_modifications[file_path] = [
-                t for t in file_modifications[file_path]
-                if current_time - t < CONFIG['time_window']
-            ]
-
-        # Détection 1: Fichiers exécutables suspects dans des emplacements non standard
-        if file_ext in CONFIG['suspicious_extensions']:
-            if event_type == "CRÉATION":
+            for event_type, file_path, event_time in batch:
+                timestamps = get_timestamps(file_path)
+                timestamps.append(event_time)
+
+                # Nettoyage des anciennes entrées (hors fenêtre temporelle)
+                while timestamps and event_time - timestamps[0] >= time_window:
+                    timestamps.popleft()
+                counts[file_path] = len(timestamps)
+
+        # Logique d'alerte après le lot, hors verrou
+        for event_type, file_path, event_time in batch:
+            # splitext évite de construire un objet Path par événement
+            file_ext = os.path.splitext(file_path)[1].lower()
+
+            # Détection 1: Fichiers exécutables suspects dans des emplacements non standard
+            if file_ext in _SUSPICIOUS_EXTS and event_type == "CRÉATION":
+                in_system_dir = os.path.normcase(file_path).startswith(_TRUSTED_PREFIXES)
                 severity = "HAUTE"
-                message = (
-                    f"🚨 ALERTE SÉCURITÉ - Fichier exécutable créé dans un emplacement surveillé\n"
-                    f"   Type: {event_type}\n"
-                    f"   Fichier: {file_path}\n"
-                    f"   Extension: {file_ext}\n"
-                    f"   Gravité: {severity}"
+                message = _EXEC_ALERT_TMPL.format(
+                    event_type=event_type, file_path=file_path,
+                    file_ext=file_ext, severity=severity
                 )
                 logging.warning(message)
-                self._log_alert(event_type, file_path, severity, "Création de fichier exécutable")
-
-        # Détection 2: Taux de modification anormalement élevé
-        modification_count = len(file_modifications[file_path])
-        if modification_count >= CONFIG['file_change_threshold']:
-            severity = "MOYENNE"
-            message = (
-                f"⚠️  ANOMALIE DÉTECTÉE - Taux de modification élevé\n"
-                f"   Fichier: {file_path}\n"
-                f"   Modifications: {modification_count} en {CONFIG['time_window']}s\n"
-                f"   Gravité: {severity}"
-            )
-            logging.warning(message)
-            self._log_alert("ANOMALIE_MODIFICATION", file_path, severity,
-                            f"Taux de modification élevé ({modification_count} fois)")
+                description = "Création de fichier exécutable"
+                if in_system_dir:
+                    description += " dans un répertoire système surveillé"
+                self._log_alert(event_type, file_path, severity, description)
+
+            # Détection 2: Taux de modification anormalement élevé
+            modification_count = counts.get(file_path, 0)
+            if modification_count >= CONFIG['file_change_threshold']:
+                severity = "MOYENNE"
+                message = _MOD_RATE_TMPL.format(
+                    file_path=file_path, count=modification_count,
+                    window=CONFIG['time_window'], severity=severity
+                )
+                logging.warning(message)
+                self._log_alert("ANOMALIE_MODIFICATION", file_path, severity,
+                                f"Taux de modification élevé ({modification_count} fois)")
 
-            # Réinitialisation du compteur après alerte
-            with modification_lock:
-                file_modifications[file_path] = []
+                # Réinitialisation du compteur après alerte (une seule
+                # alerte par lot et par fichier)
+                with modification_lock:
+                    file_modifications[file_path].clear()
+                counts[file_path] = 0
 
     def _log_alert(self, alert_type, file_path, severity, description):
         """
@@ -203,20 +378,55 @@ class FileMonitor(FileSystemEventHandler):
             severity: Niveau de gravité (BASSE, MOYENNE, HAUTE)
             description: Description détaillée de l'anomalie
         """
-        alert_entry = (
-            f"\n{'=' * 70}\n"
-            f"ALERTE DE SÉCURITÉ\n"
-            f"Horodatage: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            f"Type: {alert_type}\n"
-            f"Fichier: {file_path}\n"
-            f"Gravité: {severity}\n"
-            f"Description: {description}\n"
-            f"{'=' * 70}\n"
+        alert_entry = _ALERT_BANNER_TMPL.format(
+            timestamp=_timestamp_str(int(time.time())),
+            alert_type=alert_type, file_path=file_path,
+            severity=severity, description=description
         )
 
-        # Écriture dans un fichier d'alertes dédié
-        with open(CONFIG['log_file'], 'a', encoding='utf-8') as f:
-            f.write(alert_entry)
+        # Émis via logging : même fichier que le FileHandler, sans payer un
+        # open()/write()/close() supplémentaire par alerte
+        logging.warning(alert_entry)
+
+
+def _scan_log(log_type, cutoff):
+    """
+    Lit les événements récents d'un journal Windows (jusqu'à 100 dans la
+    fenêtre temporelle). Chaque ReadEventLog bloque sur un appel RPC au
+    service de journaux — pendant lequel pywin32 relâche le GIL — donc
+    les journaux peuvent être lus en parallèle.
+    """
+    try:
+        hand = win32evtlog.OpenEventLog(None, log_type)
+        flags = win32evtlog.EVENTLOG_BACKWARDS_READ | win32evtlog.EVENTLOG_SEQUENTIAL_READ
+
+        # Lecture des événements récents (dernière heure)
+        events = []
+
+        while len(events) < 100:  # Limite pour éviter une surcharge
+            events_batch = win32evtlog.ReadEventLog(hand, flags, 0)
+            if not events_batch:
+                break
+
+            # Lecture en ordre antichronologique : dès qu'un événement
+            # sort de la fenêtre, tout le reste du journal aussi — on
+            # coupe le batch et on arrête les appels ReadEventLog.
+            fresh = list(itertools.takewhile(
+                lambda e: not e.TimeGenerated or e.TimeGenerated >= cutoff,
+                events_batch
+            ))
+            events.extend(fresh)
+
+            if len(fresh) < len(events_batch):
+                break
+
+        del events[100:]
+        win32evtlog.CloseEventLog(hand)
+        return events
+
+    except Exception as e:
+        logging.error(f"Erreur lors de l'analyse du journal {log_type}: {str(e)}")
+        return []
 
 
 def analyze_event_logs():
@@ -226,43 +436,48 @@ def analyze_event_logs():
     """
     logs_to_check = ['Security', 'Application', 'System']
 
-    for log_type in logs_to_check:
-        try:
-            hand = win32evtlog.OpenEventLog(None, log_type)
-            flags = win32evtlog.EVENTLOG_BACKWARDS_READ | win32evtlog.EVENTLOG_SEQUENTIAL_READ
+    # Fenêtre temporelle calculée une seule fois (et non par événement)
+    cutoff = datetime.now() - timedelta(hours=1)
 
-            # Lecture des événements récents (dernière heure)
-            events = []
-            total = 0
+    # Les trois journaux sont indépendants : préchargés en parallèle, le
+    # temps d'un cycle ≈ la lecture la plus lente au lieu de la somme.
+    with ThreadPoolExecutor(max_workers=len(logs_to_check)) as executor:
+        futures = {lt: executor.submit(_scan_log, lt, cutoff) for lt in logs_to_check}
+        for log_type, future in futures.items():
+            _analyze_security_events(future.result(), log_type)
 
-            while True:
-                events_batch = win32evtlog.ReadEventLog(hand, flags, 0)
-                if not events_batch:
-                    break
 
-                for event in events_batch:
-                    # Filtrage par temps (dernière heure)
-                    if event.TimeGenerated:
-                        event_time = event.TimeGenerated
-                        if datetime.now() - event_time > timedelta(hours=1):
-                            break
+def _on_failed_login(event, log_type, counters):
+    """Event ID 4625 (Security) : tentative de connexion échouée."""
+    counters['failed_logins'] += 1
 
-                    events.append(event)
-                    total += 1
 
-                    if total >= 100:  # Limite pour éviter une surcharge
-                        break
+def _on_access_denied(event, log_type, counters):
+    """Event ID 4656 (Security) : accès refusé."""
+    counters['access_denied'] += 1
 
-                if total >= 100:
-                    break
 
-            win32evtlog.CloseEventLog(hand)
+def _on_new_service(event, log_type, counters):
+    """Event ID 7045 (System) : création d'un nouveau service."""
+    counters['new_services'] += 1
+    try:
+        event_data = win32evtlogutil.SafeFormatMessage(event, log_type)
+        logging.warning(
+            f"⚠️  Nouveau service détecté:\n"
+            f"   Event ID: 7045\n"
+            f"   Données: {event_data[:200]}"
+        )
+    except:
+        pass
 
-            # Analyse des événements collectés
-            _analyze_security_events(events, log_type)
 
-        except Exception as e:
-            logging.error(f"Erreur lors de l'analyse du journal {log_type}: {str(e)}")
+# Dispatch (event_id, journal) -> handler : un seul lookup dict par
+# événement au lieu des comparaisons chaînées dans la boucle chaude.
+_EVENT_HANDLERS = {
+    (4625, 'Security'): _on_failed_login,
+    (4656, 'Security'): _on_access_denied,
+    (7045, 'System'): _on_new_service,
+}
 
 
 def _analyze_security_events(events, log_type):
@@ -274,90 +489,156 @@ def _analyze_security_events(events, log_type):
         log_type: Type de journal (Security, Application, System)
     """
     # Compteurs pour détecter des patterns suspects
-    failed_logins = 0
-    access_denied = 0
-    new_services = 0
+    counters = {'failed_logins': 0, 'access_denied': 0, 'new_services': 0}
 
+    # Lookup du dispatch lié en local : évite la résolution de global et
+    # d'attribut à chaque itération de la boucle chaude
+    get_handler = _EVENT_HANDLERS.get
     for event in events:
-        event_id = event.EventID & 0xFFFF  # Masque pour obtenir l'ID réel
-
-        # Détection 1: Tentatives de connexion échouées (Event ID 4625)
-        if event_id == 4625 and log_type == 'Security':
-            failed_logins += 1
-
-        # Détection 2: Accès refusés répétés (Event ID 4656)
-        if event_id == 4656 and log_type == 'Security':
-            access_denied += 1
-
-        # Détection 3: Création de nouveaux services (Event ID 7045)
-        if event_id == 7045 and log_type == 'System':
-            new_services += 1
-            try:
-                event_data = win32evtlogutil.SafeFormatMessage(event, log_type)
-                logging.warning(
-                    f"⚠️  Nouveau service détecté:\n"
-                    f"   Event ID: {event_id}\n"
-                    f"   Données: {event_data[:200]}"
-                )
-            except:
-                pass
+        # Masque pour obtenir l'ID réel
+        handler = get_handler((event.EventID & 0xFFFF, log_type))
+        if handler:
+            handler(event, log_type, counters)
+
+    failed_logins = counters['failed_logins']
+    access_denied = counters['access_denied']
+    new_services = counters['new_services']
 
     # Alertes basées sur les seuils
     if failed_logins > 5:
-        severity = "HAUTE"
-        message = (
-            f"🚨 ALERTE SÉCURITÉ - Tentatives de connexion échouées multiples\n"
-            f"   Journal: {log_type}\n"
-            f"   Nombre: {failed_logins} dans la dernière heure\n"
-            f"   Gravité: {severity}\n"
-            f"   Recommandation: Vérifier les tentatives d'accès non autorisé"
-        )
-        logging.warning(message)
+        logging.warning(_FAILED_LOGINS_TMPL.format(
+            log_type=log_type, count=failed_logins, severity="HAUTE"))
 
     if access_denied > 10:
-        severity = "MOYENNE"
-        message = (
-            f"⚠️  ANOMALIE - Accès refusés répétés\n"
-            f"   Journal: {log_type}\n"
-            f"   Nombre: {access_denied} dans la dernière heure\n"
-            f"   Gravité: {severity}"
-        )
-        logging.warning(message)
+        logging.warning(_ACCESS_DENIED_TMPL.format(
+            log_type=log_type, count=access_denied, severity="MOYENNE"))
 
     if new_services > 0:
-        severity = "HAUTE"
-        message = (
-            f"🚨 ALERTE SÉCURITÉ - Création de nouveaux services\n"
-            f"   Journal: {log_type}\n"
-            f"   Nombre: {new_services}\n"
-            f"   Gravité: {severity}\n"
-            f"   Recommandation: Vérifier la légitimité des nouveaux services"
-        )
-        logging.warning(message)
+        logging.warning(_NEW_SERVICES_TMPL.format(
+            log_type=log_type, count=new_services, severity="HAUTE"))
 
 
 # ============================================================================
 # MODULE DE VÉRIFICATION D'INTÉGRITÉ DES FICHIERS CRITIQUES
 # ============================================================================
 
-def calculate_file_hash(file_path, algorithm='sha256'):
+# Bornes du chemin mmap : en dessous la lecture simple suffit, au-delà on
+# évite de mapper des fichiers démesurés et on repasse en lecture par blocs.
+_MMAP_MIN_SIZE = 1024 * 1024
+_MMAP_MAX_SIZE = 512 * 1024 * 1024
+
+# Taille de bloc du repli par lecture : 1 Mio au lieu de 8 Kio, soit ~128×
+# moins de syscalls et de tours d'interpréteur par Mio haché.
+_HASH_BUF = 1 << 20
+
+# hashlib.file_digest (Python 3.11+) : boucle lecture→update entièrement
+# en C, GIL relâché par tampon. Sondé une fois à l'import.
+_HAS_FILE_DIGEST = hasattr(hashlib, 'file_digest')
+
+# Tampon de lecture réutilisé par readinto : pas d'objet bytes alloué par
+# bloc, adresse stable pour le hacheur. Thread-local pour rester réentrant
+# quand _batch_hash et la vérification parallèle hachent simultanément.
+_read_buffers = threading.local()
+
+
+def _get_read_buffer():
+    """Retourne le bytearray de lecture du thread courant (alloué une fois)."""
+    buf = getattr(_read_buffers, 'buf', None)
+    if buf is None:
+        buf = bytearray(_HASH_BUF)
+        _read_buffers.buf = buf
+    return buf
+
+
+# Algorithme par défaut des nouvelles baselines ; les anciennes entrées
+# gardent leur champ 'algorithm' et restent validées avec lui.
+DEFAULT_HASH_ALGORITHM = 'xxh3_128' if xxhash is not None else 'sha256'
+
+
+@functools.lru_cache(maxsize=None)
+def _hash_factory(algorithm):
+    """
+    Résout une fois le constructeur de hash pour un algorithme donné
+    (xxhash pour les algorithmes xxh*, hashlib sinon). hashlib délègue à
+    OpenSSL, qui sélectionne déjà les chemins accélérés matériellement
+    (SHA-NI) au chargement quand le CPU les expose ; le surcoût restant
+    côté Python est la résolution par nom de hashlib.new() à chaque
+    appel, supprimée ici.
+    """
+    if algorithm.startswith('xxh') and xxhash is not None:
+        return getattr(xxhash, algorithm)
+    if algorithm == 'blake3' and blake3 is not None:
+        return blake3.blake3
+    ctor = getattr(hashlib, algorithm, None)
+    if ctor is not None:
+        return ctor
+    return functools.partial(hashlib.new, algorithm)
+
+
+def calculate_file_hash(file_path, algorithm=None):
     """
     Calcule le hash d'un fichier en utilisant l'algorithme spécifié.
 
     Args:
         file_path: Chemin complet du fichier
-        algorithm: Algorithme de hash (sha256 par défaut)
+        algorithm: Algorithme de hash (DEFAULT_HASH_ALGORITHM par défaut)
 
     Returns:
         Hash hexadécimal du fichier ou None en cas d'erreur
     """
+    if algorithm is None:
+        algorithm = DEFAULT_HASH_ALGORITHM
     try:
-        hash_obj = hashlib.new(algorithm)
-
-        with open(file_path, 'rb') as f:
-            # Lecture par blocs pour gérer les gros fichiers
-            while chunk := f.read(8192):
-                hash_obj.update(chunk)
+        # BLAKE3 : update_mmap mappe et hache le fichier entier côté natif,
+        # avec parallélisme interne — aucun tampon ni boucle Python
+        if algorithm == 'blake3' and blake3 is not None:
+            hash_obj = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hash_obj.update_mmap(file_path)
+            return hash_obj.hexdigest()
+
+        # buffering=0 : les lectures sont déjà larges et explicites, le
+        # tampon de 8 Kio de l'IO bufferisée ne ferait que recopier
+        with open(file_path, 'rb', buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+
+            # Fichiers froids : annoncer le parcours séquentiel (read-ahead
+            # agressif) et le non-réemploi des pages, pour ne pas polluer le
+            # pagecache pendant un scan d'intégrité. Advice posés séparément :
+            # ce sont des valeurs d'énumération, pas des drapeaux combinables.
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_NOREUSE)
+
+            # Gros binaires (DLL/EXE de plusieurs Mo) : mapper le fichier et
+            # le hacher en UN SEUL update C sur la memoryview — pas de boucle
+            # interpréteur. Plafonné pour ne pas mapper des fichiers énormes.
+            if _MMAP_MIN_SIZE <= size <= _MMAP_MAX_SIZE:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        # Indique au noyau un parcours séquentiel imminent :
+                        # read-ahead agressif, pages libérables derrière nous
+                        if hasattr(mm, 'madvise'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                            mm.madvise(mmap.MADV_WILLNEED)
+                        hash_obj = _hash_factory(algorithm)()
+                        hash_obj.update(memoryview(mm))
+                        return hash_obj.hexdigest()
+                except (ValueError, OSError):
+                    f.seek(0)  # mmap indisponible : lecture classique
+
+            if _HAS_FILE_DIGEST:
+                # Python 3.11+ : la boucle de lecture reste côté C (OpenSSL),
+                # avec les chemins SHA accélérés matériellement si disponibles
+                hash_obj = hashlib.file_digest(f, _hash_factory(algorithm))
+            else:
+                hash_obj = _hash_factory(algorithm)()
+                # Lecture par blocs dans un tampon réutilisé : readinto
+                # remplit le bytearray en place, la memoryview tranche
+                # sans copie pour l'update
+                buf = _get_read_buffer()
+                mv = memoryview(buf)
+                while n := f.readinto(buf):
+                    hash_obj.update(mv[:n])
 
         return hash_obj.hexdigest()
 
@@ -372,6 +653,52 @@ def calculate_file_hash(file_path, algorithm='sha256'):
         return None
 
 
+def _load_baseline_file(baseline_file):
+    """
+    Charge la baseline depuis le disque. Le codec est choisi d'après
+    l'extension du fichier : MessagePack pour .msgpack, sinon JSON
+    (orjson si disponible).
+    """
+    with open(baseline_file, 'rb') as f:
+        data = f.read()
+    if baseline_file.endswith('.msgpack') and msgpack is not None:
+        raw = msgpack.unpackb(data, raw=False)
+    elif orjson is not None:
+        raw = orjson.loads(data)
+    else:
+        raw = json.loads(data)
+    # Chemins internés : l'ensemble est petit et fixe, les lookups répétés
+    # de chaque cycle se font alors par comparaison de pointeurs
+    return {sys.intern(k): v for k, v in raw.items()}
+
+
+def _save_baseline_file(baseline_file, baseline):
+    """Écrit la baseline sur le disque (même dispatch que le chargement)."""
+    if baseline_file.endswith('.msgpack') and msgpack is not None:
+        payload = msgpack.packb(baseline, use_bin_type=True)
+    elif orjson is not None:
+        payload = orjson.dumps(baseline, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(baseline, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(baseline_file, 'wb') as f:
+        f.write(payload)
+
+
+def _batch_hash(files, algorithm=None):
+    """
+    Hache un lot de fichiers en parallèle et retourne {chemin: hash}.
+    Les kernels de hachage (OpenSSL, xxhash, blake3) relâchent le GIL :
+    un pool de threads fait travailler plusieurs cœurs sur le lot, les
+    lectures disque des uns recouvrant le calcul des autres. Les fichiers
+    en erreur sont absents du résultat.
+    """
+    if not files:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        hashes = executor.map(lambda p: calculate_file_hash(p, algorithm), files)
+    return {path: h for path, h in zip(files, hashes) if h}
+
+
 def initialize_file_integrity():
     """
     Initialise la baseline d'intégrité des fichiers critiques.
@@ -381,41 +708,49 @@ def initialize_file_integrity():
 
     baseline_file = CONFIG['hash_db_file']
 
-    # Si la baseline existe, la charger
-    if os.path.exists(baseline_file):
+    # Si la baseline existe, la charger (l'ouverture sert de test d'existence)
+    try:
+        baseline = _load_baseline_file(baseline_file)
         logging.info(f"✓ Baseline d'intégrité existante trouvée: {baseline_file}")
-        try:
-            with open(baseline_file, 'r', encoding='utf-8') as f:
-                baseline = json.load(f)
-            logging.info(f"✓ {len(baseline)} fichiers chargés depuis la baseline")
-            return baseline
-        except Exception as e:
-            logging.error(f"Erreur lors du chargement de la baseline: {str(e)}")
-            logging.info("Création d'une nouvelle baseline...")
+        logging.info(f"✓ {len(baseline)} fichiers chargés depuis la baseline")
+        return baseline
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.error(f"Erreur lors du chargement de la baseline: {str(e)}")
+        logging.info("Création d'une nouvelle baseline...")
 
     # Créer une nouvelle baseline
     logging.info("📝 Création de la baseline d'intégrité initiale...")
     baseline = {}
 
+    # Un seul os.stat par fichier : il sert à la fois de test d'existence
+    # et de source des métadonnées stockées dans la baseline
+    stats = {}
     for file_path in CONFIG['critical_files']:
-        if os.path.exists(file_path):
-            file_hash = calculate_file_hash(file_path)
-            if file_hash:
-                file_size = os.path.getsize(file_path)
-                baseline[file_path] = {
-                    'hash': file_hash,
-                    'size': file_size,
-                    'timestamp': datetime.now().isoformat(),
-                    'algorithm': 'sha256'
-                }
-                logging.info(f"  ✓ {os.path.basename(file_path)}: {file_hash[:16]}...")
-        else:
+        try:
+            stats[file_path] = os.stat(file_path)
+        except OSError:
             logging.warning(f"  ✗ Fichier critique introuvable: {file_path}")
+    existing_files = list(stats)
+
+    # Hachage du lot en parallèle (voir _batch_hash)
+    for file_path, file_hash in _batch_hash(existing_files).items():
+        st = stats[file_path]
+        baseline[file_path] = {
+            'hash': file_hash,
+            'size': st.st_size,
+            # mtime en nanosecondes : permet de court-circuiter le
+            # re-hachage périodique tant que (mtime, taille) sont stables
+            'mtime_ns': st.st_mtime_ns,
+            'timestamp': datetime.now().isoformat(),
+            'algorithm': DEFAULT_HASH_ALGORITHM
+        }
+        logging.info(f"  ✓ {os.path.basename(file_path)}: {file_hash[:16]}...")
 
     # Sauvegarder la baseline
     try:
-        with open(baseline_file, 'w', encoding='utf-8') as f:
-            json.dump(baseline, f, indent=2, ensure_ascii=False)
+        _save_baseline_file(baseline_file, baseline)
         logging.info(f"✓ Baseline sauvegardée: {len(baseline)} fichiers\n")
     except Exception as e:
         logging.error(f"Erreur lors de la sauvegarde de la baseline: {str(e)}")
@@ -423,6 +758,86 @@ def initialize_file_integrity():
     return baseline
 
 
+# Mémoïsation (chemin, mtime_ns, taille) -> hash, en mémoire du processus :
+# couvre les entrées d'anciennes baselines sans métadonnées stockées, qui
+# sinon seraient re-hachées à chaque cycle tant que la baseline n'est pas
+# réécrite. Les binaires OS changent rarement : taux de hit proche de 100 %.
+_hash_memo = {}
+
+
+def _fast_scan(baseline):
+    """
+    Première étape du contrôle : un os.stat par entrée, aucun octet lu.
+    Classe chaque fichier en manquant, intact (métadonnées identiques à
+    la baseline) ou suspect (métadonnées divergentes ou absentes).
+
+    Returns:
+        Tuple (suspects, intact, missing) où suspects et intact sont des
+        listes de (file_path, stat_result) et missing une liste de chemins.
+    """
+    suspects = []
+    intact = []
+    missing = []
+    for file_path, baseline_info in baseline.items():
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            missing.append(file_path)
+            continue
+
+        # Si (mtime_ns, taille) correspondent à la baseline, le contenu
+        # n'a très probablement pas changé. En régime stable, le cycle se
+        # réduit à N stat().
+        if (baseline_info.get('mtime_ns') is not None
+                and st.st_mtime_ns == baseline_info['mtime_ns']
+                and st.st_size == baseline_info.get('size')):
+            intact.append((file_path, st))
+        else:
+            suspects.append((file_path, st))
+    return suspects, intact, missing
+
+
+def _deep_verify_one(args):
+    """
+    Seconde étape : hache réellement un fichier et le compare à la
+    baseline. Conçu pour tourner dans un pool de threads : aucun logging
+    ici, le thread principal émet les alertes.
+
+    Returns:
+        Tuple (file_path, status, détails) où status vaut 'verified',
+        'modified', 'stale' (hash intact mais métadonnées à rafraîchir)
+        ou 'error'. `force` vaut True pour les fichiers échantillonnés.
+    """
+    file_path, st, baseline_info, force = args
+
+    # Calculer le hash actuel, avec l'algorithme enregistré dans la
+    # baseline : les anciennes entrées SHA-256 restent validées telles
+    # quelles, les nouvelles utilisent l'algorithme par défaut
+    algorithm = baseline_info.get('algorithm', 'sha256')
+    memo_key = (file_path, algorithm, st.st_mtime_ns, st.st_size)
+    # L'échantillon anti-évasion contourne la mémo : sa raison d'être est
+    # une altération masquée par (mtime, taille) restaurés, exactement la
+    # clé sur laquelle la mémo rendrait le hash pré-altération. On re-hache
+    # toujours et on rafraîchit l'entrée ; la mémo ne sert que le chemin
+    # suspects / anciennes baselines pour lequel elle a été introduite.
+    current_hash = None if force else _hash_memo.get(memo_key)
+    if current_hash is None:
+        current_hash = calculate_file_hash(file_path, algorithm)
+        if not current_hash:
+            return (file_path, 'error', None)
+        _hash_memo[memo_key] = current_hash
+
+    if current_hash != baseline_info['hash']:
+        return (file_path, 'modified', (current_hash, st.st_size))
+
+    # Hash intact : si les métadonnées stockées diffèrent (mtime touché,
+    # ancienne baseline sans mtime_ns), elles sont à rafraîchir
+    if (baseline_info.get('mtime_ns') == st.st_mtime_ns
+            and baseline_info.get('size') == st.st_size):
+        return (file_path, 'verified', None)
+    return (file_path, 'stale', st)
+
+
 def verify_file_integrity():
     """
     Vérifie l'intégrité de tous les fichiers critiques en comparant
@@ -430,16 +845,15 @@ def verify_file_integrity():
     """
     logging.info("🔍 Vérification de l'intégrité des fichiers critiques...")
 
-    # Charger la baseline
+    # Charger la baseline (l'ouverture sert de test d'existence : pas de
+    # stat préalable redondant)
     baseline_file = CONFIG['hash_db_file']
-    if not os.path.exists(baseline_file):
+    try:
+        baseline = _load_baseline_file(baseline_file)
+    except FileNotFoundError:
         logging.warning("⚠️  Baseline d'intégrité non trouvée. Création en cours...")
         initialize_file_integrity()
         return
-
-    try:
-        with open(baseline_file, 'r', encoding='utf-8') as f:
-            baseline = json.load(f)
     except Exception as e:
         logging.error(f"Erreur lors du chargement de la baseline: {str(e)}")
         return
@@ -448,11 +862,36 @@ def verify_file_integrity():
     verified = 0
     modified = 0
     missing = 0
-
-    # Vérifier chaque fichier de la baseline
-    for file_path, baseline_info in baseline.items():
-        # Vérifier l'existence du fichier
-        if not os.path.exists(file_path):
+    baseline_dirty = False
+
+    # Étape 1 : balayage métadonnées, O(N) syscalls sans lecture
+    suspects, intact, missing_paths = _fast_scan(baseline)
+
+    # Étape 2 : hash cryptographique des seuls suspects, plus un
+    # échantillon aléatoire (~10 %) des fichiers réputés intacts pour
+    # déjouer une altération masquée par restauration du mtime
+    sample_size = max(1, len(intact) // 10) if intact else 0
+    sampled = random.sample(intact, sample_size) if sample_size else []
+    to_verify = ([(fp, st, baseline[fp], False) for fp, st in suspects]
+                 + [(fp, st, baseline[fp], True) for fp, st in sampled])
+
+    verified += len(intact) - len(sampled)
+
+    # Hachage en parallèle : hashlib relâche le GIL pendant les updates C,
+    # les threads recouvrent donc les E/S et le hachage. executor.map
+    # préserve l'ordre, donc les alertes (émises ci-dessous par le thread
+    # principal) restent déterministes.
+    if not to_verify:
+        results = []
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            results = list(executor.map(_deep_verify_one, to_verify))
+    results = [(fp, 'missing', None) for fp in missing_paths] + results
+
+    for file_path, status, details in results:
+        baseline_info = baseline[file_path]
+
+        if status == 'missing':
             missing += 1
             severity = "CRITIQUE"
             message = (
@@ -465,19 +904,12 @@ def verify_file_integrity():
             logging.critical(message)
             _log_integrity_alert(file_path, "FICHIER_MANQUANT", severity,
                                  "Fichier système critique supprimé ou déplacé")
-            continue
 
-        # Calculer le hash actuel
-        current_hash = calculate_file_hash(file_path)
-        if not current_hash:
-            continue
-
-        # Comparer avec la baseline
-        if current_hash != baseline_info['hash']:
+        elif status == 'modified':
             modified += 1
+            current_hash, current_size = details
 
             # Vérifier également la taille du fichier
-            current_size = os.path.getsize(file_path)
             size_changed = current_size != baseline_info.get('size', 0)
 
             severity = "CRITIQUE"
@@ -498,9 +930,26 @@ def verify_file_integrity():
                 description += f" | Taille modifiée ({baseline_info.get('size')} -> {current_size} octets)"
 
             _log_integrity_alert(file_path, "MODIFICATION_FICHIER", severity, description)
-        else:
+
+        elif status == 'verified':
             verified += 1
 
+        elif status == 'stale':
+            verified += 1
+            # Hash intact mais métadonnées divergentes (ex : mtime touché,
+            # ancienne baseline sans mtime_ns) : rafraîchir pour que les
+            # prochains cycles bénéficient du court-circuit stat
+            st = details
+            baseline_info['size'] = st.st_size
+            baseline_info['mtime_ns'] = st.st_mtime_ns
+            baseline_dirty = True
+
+    if baseline_dirty:
+        try:
+            _save_baseline_file(baseline_file, baseline)
+        except Exception as e:
+            logging.error(f"Erreur lors de la sauvegarde de la baseline: {str(e)}")
+
     # Rapport de vérification
     total = len(baseline)
     logging.info(
@@ -508,6 +957,9 @@ def verify_file_integrity():
         f"{modified} modifiés, {missing} manquants"
     )
 
+    # Écriture groupée des alertes du cycle
+    _flush_integrity_alerts()
+
     if modified > 0 or missing > 0:
         logging.warning(
             f"\n⚠️  ATTENTION: Des anomalies d'intégrité ont été détectées!\n"
@@ -516,10 +968,39 @@ def verify_file_integrity():
             f"   Consultez {CONFIG['log_file']} pour les détails.\n"
         )
 
+    # Nombre d'anomalies, exploité par la boucle principale pour adapter
+    # la cadence de vérification
+    return modified + missing
+
+
+# Template d'alerte d'intégrité construit une seule fois au chargement,
+# séparateurs inclus : sous rafale, un .format() par alerte au lieu de
+# réassembler les morceaux constants et '=' * 70 deux fois par appel.
+_INTEGRITY_ALERT_TMPL = (
+    "\n" + "=" * 70 + "\n"
+    "ALERTE D'INTÉGRITÉ - FICHIER SYSTÈME\n"
+    "Horodatage: {timestamp}\n"
+    "Type: {alert_type}\n"
+    "Fichier: {file_path}\n"
+    "Gravité: {severity}\n"
+    "Description: {description}\n"
+    "Recommandation: Vérifier immédiatement l'intégrité du système\n"
+    + "=" * 70 + "\n"
+)
+
+# Alertes d'intégrité en attente d'écriture : tamponnées pendant un cycle
+# de vérification puis écrites en un seul open/write/close, au lieu d'un
+# triple syscall par alerte quand plusieurs fichiers changent à la fois.
+# Le verrou garde le tampon et l'append cohérents quand la vérification
+# tourne sur un thread du pool pendant que l'agent s'arrête.
+_pending_alerts = []
+_alerts_lock = threading.Lock()
+
 
 def _log_integrity_alert(file_path, alert_type, severity, description):
     """
-    Enregistre une alerte d'intégrité dans le fichier de log.
+    Met en tampon une alerte d'intégrité ; l'écriture effective se fait
+    par lot via _flush_integrity_alerts.
 
     Args:
         file_path: Chemin du fichier concerné
@@ -527,20 +1008,49 @@ def _log_integrity_alert(file_path, alert_type, severity, description):
         severity: Niveau de gravité (CRITIQUE, HAUTE, MOYENNE)
         description: Description détaillée de l'anomalie
     """
-    alert_entry = (
-        f"\n{'=' * 70}\n"
-        f"ALERTE D'INTÉGRITÉ - FICHIER SYSTÈME\n"
-        f"Horodatage: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        f"Type: {alert_type}\n"
-        f"Fichier: {file_path}\n"
-        f"Gravité: {severity}\n"
-        f"Description: {description}\n"
-        f"Recommandation: Vérifier immédiatement l'intégrité du système\n"
-        f"{'=' * 70}\n"
+    # Horodatage mémoïsé à la seconde : toutes les alertes d'un même
+    # passage de vérification partagent le même strftime
+    alert_entry = _INTEGRITY_ALERT_TMPL.format(
+        timestamp=_timestamp_str(int(time.time())),
+        alert_type=alert_type, file_path=file_path,
+        severity=severity, description=description
     )
 
-    with open(CONFIG['log_file'], 'a', encoding='utf-8') as f:
-        f.write(alert_entry)
+    with _alerts_lock:
+        _pending_alerts.append(alert_entry)
+
+
+def _flush_integrity_alerts():
+    """Écrit toutes les alertes en attente en un seul append."""
+    with _alerts_lock:
+        if not _pending_alerts:
+            return
+        entries = ''.join(_pending_alerts)
+        _pending_alerts.clear()
+        with open(CONFIG['log_file'], 'a', encoding='utf-8') as f:
+            f.write(entries)
+
+
+# Un crash entre deux cycles ne doit pas perdre d'alertes tamponnées
+atexit.register(_flush_integrity_alerts)
+
+
+def _create_observer():
+    """
+    Crée l'observateur watchdog, avec un tampon ReadDirectoryChangesW
+    élargi sous Windows : le tampon par défaut déborde sous rafale
+    d'événements et force watchdog à re-scanner les répertoires
+    surveillés en entier. Repli sur l'Observer par défaut ailleurs.
+    """
+    if sys.platform.startswith('win'):
+        try:
+            from watchdog.observers import winapi
+            from watchdog.observers.read_directory_changes import WindowsApiObserver
+            winapi.BUFFER_SIZE = 64 * 1024
+            return WindowsApiObserver()
+        except Exception:
+            pass
+    return Observer()
 
 
 def main_loop():
@@ -555,7 +1065,7 @@ def main_loop():
 
     # Configuration de la surveillance des fichiers
     event_handler = FileMonitor()
-    observer = Observer()
+    observer = _create_observer()
 
     # Ajout des répertoires à surveiller
     for directory in CONFIG['monitored_dirs']:
@@ -570,25 +1080,58 @@ def main_loop():
     # Compteur pour la vérification d'intégrité périodique
     last_integrity_check = time.time()
 
+    # Intervalles figés à l'entrée de boucle : ils ne changent jamais en
+    # cours d'exécution, inutile de re-consulter CONFIG à chaque tour.
+    # L'intervalle d'intégrité est adaptatif : doublé après 3 cycles sans
+    # anomalie (plafonné à 1 h), ramené au minimum configuré dès qu'une
+    # modification ou disparition est détectée.
+    min_integrity_interval = CONFIG['integrity_check_interval']
+    max_integrity_interval = 3600
+    integrity_interval = min_integrity_interval
+    quiet_cycles = 0
+    sleep_interval = CONFIG['check_interval']
+
+    # Pool de la boucle principale : l'analyse des journaux et la
+    # vérification d'intégrité sont indépendantes et liées aux E/S — les
+    # recouvrir évite que le hachage bloque la lecture des journaux, et
+    # inversement.
+    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='agent-task')
+
     try:
         while True:
             # Analyse périodique des journaux d'événements
             logging.info("🔎 Analyse des journaux d'événements Windows...")
-            analyze_event_logs()
+            fut_logs = pool.submit(analyze_event_logs)
 
             # Vérification d'intégrité des fichiers critiques (toutes les X secondes)
+            fut_integrity = None
             current_time = time.time()
-            if current_time - last_integrity_check >= CONFIG['integrity_check_interval']:
-                verify_file_integrity()
+            if current_time - last_integrity_check >= integrity_interval:
+                fut_integrity = pool.submit(verify_file_integrity)
                 last_integrity_check = current_time
 
+            # Attendre les deux tâches (lancées en parallèle) avant de dormir
+            fut_logs.result()
+            if fut_integrity is not None:
+                anomalies = fut_integrity.result() or 0
+                if anomalies:
+                    integrity_interval = min_integrity_interval
+                    quiet_cycles = 0
+                else:
+                    quiet_cycles += 1
+                    if quiet_cycles >= 3:
+                        integrity_interval = min(integrity_interval * 2,
+                                                 max_integrity_interval)
+                        quiet_cycles = 0
+
             # Attente avant la prochaine analyse
-            time.sleep(CONFIG['check_interval'])
+            time.sleep(sleep_interval)
 
     except KeyboardInterrupt:
         logging.info("\n\n⛔ Arrêt de l'agent de surveillance demandé...")
         observer.stop()
 
+    pool.shutdown(wait=True)
     observer.join()
     logging.info("✓ Agent de surveillance arrêté proprement.")
 
@@ -13,24 +13,58 @@ sur un système non-Windows.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
-from dataclasses import asdict, is_dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, fields, is_dataclass
 from typing import Any, Dict, List, Optional
 
+# orjson (optionnel) sérialise l'arbre en une seule passe C, nettement plus
+# vite que json stdlib ; repli silencieux sur json s'il n'est pas installé.
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+@functools.cache
+def _dataclass_field_names(cls) -> tuple:
+    """Noms de champs d'une dataclass, calculés une fois par classe."""
+    return tuple(f.name for f in fields(cls))
+
 
 def _to_serializable(obj: Any) -> Any:
-    if is_dataclass(obj):
-        return asdict(obj)
-    if isinstance(obj, (list, tuple)):
-        return [_to_serializable(x) for x in obj]
-    if isinstance(obj, dict):
-        return {k: _to_serializable(v) for k, v in obj.items()}
-    # fallback
-    try:
-        return str(obj)
-    except Exception:
-        return None
+    # Parcours itératif avec pile explicite : évite un frame Python par
+    # nœud (et la limite de récursion) sur les gros arbres de résultats.
+    root = [obj]
+    stack = [(root, 0, obj)]
+    while stack:
+        container, key, value = stack.pop()
+        t = type(value)
+        if is_dataclass(value) and not isinstance(value, type):
+            value = {name: getattr(value, name) for name in _dataclass_field_names(t)}
+            t = dict
+        if t is dict:
+            new: Any = {}
+            container[key] = new
+            for k, v in value.items():
+                stack.append((new, k, v))
+        elif t is list or t is tuple:
+            new = [None] * len(value)
+            container[key] = new
+            for i, v in enumerate(value):
+                stack.append((new, i, v))
+        elif value is None or t in (str, int, float, bool):
+            container[key] = value
+        else:
+            # fallback
+            try:
+                container[key] = str(value)
+            except Exception:
+                container[key] = None
+    return root[0]
 
 
 def main():
@@ -82,6 +116,13 @@ def main():
     msg_gen = MessageGenerator()
     classifier = Classifier()
 
+    # psutil est optionnel : importé une seule fois ici au lieu d'un
+    # import (et de sa vérification de cache) par itération de la boucle
+    try:
+        import psutil
+    except Exception:
+        psutil = None
+
     # Collect processes
     processes = []
     if proc_lister:
@@ -89,12 +130,9 @@ def main():
             processes = proc_lister.list_processes()
         except Exception:
             processes = []
-    else:
+    elif psutil:
         # best-effort fallback using psutil if available
         try:
-            import psutil
-
-            procs = []
             for p in psutil.process_iter(attrs=["pid", "name", "exe", "cmdline", "username", "ppid"]):
                 info = p.info
                 processes.append(info)
@@ -104,9 +142,47 @@ def main():
     # Limit processes
     targets = processes[: args.limit]
 
+    # Connexions réseau collectées en un seul scan global pour tous les PID
+    # ciblés (au lieu d'un NetworkAnalyzer par processus dans la boucle)
+    connections_by_pid = {}
+    if NetworkAnalyzer:
+        try:
+            target_pids = set()
+            for proc in targets:
+                pid = proc.pid if is_dataclass(proc) else (proc.get("pid") if isinstance(proc, dict) else None)
+                if pid:
+                    target_pids.add(pid)
+            connections_by_pid = NetworkAnalyzer.bulk_connections(target_pids)
+        except Exception:
+            connections_by_pid = {}
+
+    # Un handle psutil.Process par PID ciblé, construits avant la boucle :
+    # l'enrichissement réutilise ces objets au lieu d'en recréer un chacun.
+    proc_objs: Dict[int, Any] = {}
+    if psutil:
+        for proc in targets:
+            pid = proc.pid if is_dataclass(proc) else (proc.get("pid") if isinstance(proc, dict) else None)
+            if pid:
+                try:
+                    proc_objs[pid] = psutil.Process(pid)
+                except Exception:
+                    pass
+
+    # Échantillonnage CPU non bloquant : cpu_percent(None) amorce le compteur
+    # de chaque handle, un seul sleep partagé couvre tous les processus, et
+    # la boucle lira le delta. Avec interval=0.1 par processus, le parcours
+    # bloquait 0,1 s × N ; ici 0,1 s au total.
+    if proc_objs:
+        for proc_obj in proc_objs.values():
+            try:
+                proc_obj.cpu_percent(None)
+            except Exception:
+                pass
+        time.sleep(0.1)
+
     results = []
 
-    for proc in targets:
+    def analyze_one(proc):
         # normalize process information
         try:
             # If proc is a dataclass (ProcessInfo), convert to dict
@@ -124,13 +200,11 @@ def main():
         name = pdict.get("name") or pdict.get("exe") or ""
         exe_path = pdict.get("exe") or pdict.get("exe_path") or None
 
-        # Network
+        # Network (déjà collecté en bloc avant la boucle)
         network_list = []
-        if NetworkAnalyzer and pid:
+        if pid in connections_by_pid:
             try:
-                na = NetworkAnalyzer(pid)
-                conns = na.list_connections()
-                network_list = _to_serializable(conns)
+                network_list = _to_serializable(connections_by_pid[pid])
             except Exception:
                 network_list = []
 
@@ -168,33 +242,24 @@ def main():
         }
 
         # try to enrich with parent name / cpu / mem using psutil
-        try:
-            import psutil
-            proc_obj = None
+        proc_obj = proc_objs.get(pid)
+        if proc_obj:
             try:
-                proc_obj = psutil.Process(pid)
+                parent = proc_obj.parent()
+                process_data["parent_name"] = parent.name() if parent else None
             except Exception:
-                proc_obj = None
-
-            if proc_obj:
-                try:
-                    parent = proc_obj.parent()
-                    process_data["parent_name"] = parent.name() if parent else None
-                except Exception:
-                    process_data["parent_name"] = None
+                process_data["parent_name"] = None
 
-                try:
-                    process_data["cpu_percent"] = float(proc_obj.cpu_percent(interval=0.1))
-                except Exception:
-                    process_data["cpu_percent"] = 0
+            try:
+                process_data["cpu_percent"] = float(proc_obj.cpu_percent(None))
+            except Exception:
+                process_data["cpu_percent"] = 0
 
-                try:
-                    mem = proc_obj.memory_info().rss
-                    process_data["memory_rss"] = int(mem)
-                except Exception:
-                    process_data["memory_rss"] = 0
-        except Exception:
-            pass
+            try:
+                mem = proc_obj.memory_info().rss
+                process_data["memory_rss"] = int(mem)
+            except Exception:
+                process_data["memory_rss"] = 0
 
         # Run heuristic engine
         try:
@@ -227,7 +292,7 @@ def main():
         except Exception as e:
             classification_ser = {"error": "classification failed", "detail": str(e)}
 
-        result = {
+        return {
             "process": _to_serializable(pdict),
             "network": network_list,
             "hash": hash_result,
@@ -238,15 +303,32 @@ def main():
             "classification": classification_ser,
         }
 
-        results.append(result)
-
-        # Output streaming option
-        if args.json_lines:
-            print(json.dumps(_to_serializable(result), ensure_ascii=False))
+    # Analyse en parallèle : chaque cible fait des E/S indépendantes
+    # (lecture du binaire pour le hash, syscalls psutil) qui relâchent le
+    # GIL ; un petit pool de threads recouvre ces attentes. Les moteurs
+    # d'analyse sont en lecture seule après construction, et pool.map
+    # restitue les résultats dans l'ordre des cibles.
+    with ThreadPoolExecutor(max_workers=min(8, len(targets)) or 1) as pool:
+        for result in pool.map(analyze_one, targets):
+            results.append(result)
+
+            # Output streaming option. Chaque composant du résultat est déjà
+            # passé par _to_serializable : inutile de re-parcourir l'arbre.
+            if args.json_lines:
+                if orjson is not None:
+                    sys.stdout.buffer.write(orjson.dumps(result, default=str) + b"\n")
+                    sys.stdout.buffer.flush()
+                else:
+                    print(json.dumps(result, ensure_ascii=False))
 
     # Final output
     if not args.json_lines:
-        print(json.dumps(_to_serializable(results), indent=2, ensure_ascii=False))
+        if orjson is not None:
+            sys.stdout.buffer.write(
+                orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2) + b"\n"
+            )
+        else:
+            print(json.dumps(results, indent=2, ensure_ascii=False))
 
 
 if __name__ == "__main__":
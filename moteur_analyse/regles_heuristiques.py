@@ -29,18 +29,24 @@ class RulePathTmp(HeuristicRule):
     rule_id = "PATH_TMP"
     score = 20
 
-    def check(self, data):
-        exe = data.get("exe_path", "").lower()
-        suspicious_paths = ["/tmp", "appdata\\local\\temp", "downloads", "/var/tmp"]
+    # Tuple au niveau de la classe : plus de liste réallouée à chaque check,
+    # et str.startswith accepte un tuple — tous les préfixes sont testés en
+    # un seul appel C au lieu d'une boucle Python.
+    _SUSPICIOUS_PATHS = ("/tmp", "appdata\\local\\temp", "downloads", "/var/tmp")
 
-        for p in suspicious_paths:
-            if exe.startswith(p):
-                return [HeuristicResult(
-                    rule_id=self.rule_id,
-                    score=self.score,
-                    message=f"Le processus s'exécute depuis {p}, ce qui est inhabituel.",
-                    metadata={"exe": exe}
-                )]
+    def check(self, data):
+        exe = data.get("_exe_path_lower")
+        if exe is None:
+            exe = (data.get("exe_path") or "").lower()
+        if exe.startswith(self._SUSPICIOUS_PATHS):
+            # Branche rare : retrouver le préfixe touché pour le message
+            p = next(p for p in self._SUSPICIOUS_PATHS if exe.startswith(p))
+            return [HeuristicResult(
+                rule_id=self.rule_id,
+                score=self.score,
+                message=f"Le processus s'exécute depuis {p}, ce qui est inhabituel.",
+                metadata={"exe": exe}
+            )]
         return []
 
 
@@ -84,13 +90,16 @@ class RuleSuspiciousRemoteIP(HeuristicRule):
     rule_id = "NETWORK_SUSPICIOUS_IP"
     score = 30
 
+    # frozenset de classe : test d'appartenance par hachage en O(1), sans
+    # reconstruire le tuple à chaque processus analysé.
+    _SUSPICIOUS_ZONES = frozenset(("ru", "cn", "kp", "ir"))
+
     def check(self, data):
-        suspicious_zones = ("ru", "cn", "kp", "ir")
         result = []
 
         for conn in data.get("network", []):
             geo = conn.get("geo", "")
-            if geo.lower() in suspicious_zones:
+            if geo.lower() in self._SUSPICIOUS_ZONES:
                 result.append(HeuristicResult(
                     rule_id=self.rule_id,
                     score=self.score,
@@ -109,7 +118,9 @@ class RuleUnsignedBinary(HeuristicRule):
     score = 10
 
     def check(self, data):
-        if data.get("signature", {}).get("signed") is False:
+        # L'orchestrateur passe signature=None hors Windows : le défaut de
+        # .get ne s'applique pas à une clé présente à None.
+        if (data.get("signature") or {}).get("signed") is False:
             return [HeuristicResult(
                 rule_id=self.rule_id,
                 score=self.score,
@@ -124,7 +135,9 @@ class RuleUnexpectedAdmin(HeuristicRule):
     score = 20
 
     def check(self, data):
-        user = data.get("user", "").lower()
+        user = data.get("_user_lower")
+        if user is None:
+            user = (data.get("user") or "").lower()
         if user in ("root", "administrator"):
             parent = data.get("parent_name", "")
             if parent not in ("systemd", "services.exe", "wininit.exe"):
@@ -181,18 +194,27 @@ class RuleSuspiciousParent(HeuristicRule):
     rule_id = "SUSPICIOUS_PARENT"
     score = 25
 
-    def check(self, data):
-        parent = data.get("parent_name", "").lower()
-        child = data.get("name", "").lower()
-
-        suspicious_pairs = [
-            ("word.exe", "powershell.exe"),
-            ("winword.exe", "cmd.exe"),
-            ("firefox", "bash"),
-            ("chrome", "python"),
-        ]
+    _SUSPICIOUS_PAIRS = (
+        ("word.exe", "powershell.exe"),
+        ("winword.exe", "cmd.exe"),
+        ("firefox", "bash"),
+        ("chrome", "python"),
+    )
+    # Garde rapide : un seul startswith C sur les parents suspects écarte
+    # l'immense majorité des processus avant la boucle sur les paires.
+    _SUSPICIOUS_PARENTS = tuple(p for p, _ in _SUSPICIOUS_PAIRS)
 
-        for p, c in suspicious_pairs:
+    def check(self, data):
+        parent = data.get("_parent_name_lower")
+        if parent is None:
+            parent = (data.get("parent_name") or "").lower()
+        if not parent.startswith(self._SUSPICIOUS_PARENTS):
+            return []
+        child = data.get("_name_lower")
+        if child is None:
+            child = (data.get("name") or "").lower()
+
+        for p, c in self._SUSPICIOUS_PAIRS:
             if parent.startswith(p) and child.startswith(c):
                 return [HeuristicResult(
                     rule_id=self.rule_id,
@@ -212,7 +234,7 @@ class RuleIntegrityFailed(HeuristicRule):
     score = 40
 
     def check(self, data):
-        integ = data.get("integrity", {})
+        integ = data.get("integrity") or {}
         if integ.get("status") == "modified":
             return [HeuristicResult(
                 rule_id=self.rule_id,
@@ -241,19 +263,33 @@ class HeuristicEngine:
             RuleSuspiciousParent(),
             RuleIntegrityFailed()
         ]
+        # Méthodes check pré-liées : la boucle de dispatch évite une
+        # résolution d'attribut par règle et par processus analysé.
+        self._checks = [rule.check for rule in self.rules]
 
     def analyze(self, process_data: dict) -> Dict[str, Any]:
         """Retourne un score total + la liste des règles activées."""
-        results: List[HeuristicResult] = []
-
-        for rule in self.rules:
-            r = rule.check(process_data)
-            if r:
-                results.extend(r)
-
-        total_score = sum(r.score for r in results)
+        # Normalisation partagée : plusieurs règles consomment les mêmes
+        # chaînes en minuscules, les calculer une fois ici évite un .lower()
+        # (allocation + parcours) par règle. `or ""` absorbe les None que
+        # l'orchestrateur laisse dans parent_name.
+        process_data["_exe_path_lower"] = (process_data.get("exe_path") or "").lower()
+        process_data["_user_lower"] = (process_data.get("user") or "").lower()
+        process_data["_parent_name_lower"] = (process_data.get("parent_name") or "").lower()
+        process_data["_name_lower"] = (process_data.get("name") or "").lower()
+
+        # Une seule passe : le score s'accumule pendant la collecte au lieu
+        # d'un second parcours des résultats. vars(r) rend le __dict__ du
+        # dataclass tel quel, sans reconstruction.
+        triggers: List[dict] = []
+        total_score = 0
+
+        for check in self._checks:
+            for r in check(process_data):
+                total_score += r.score
+                triggers.append(vars(r))
 
         return {
             "score": total_score,
-            "triggers": [r.__dict__ for r in results]
+            "triggers": triggers
         }
@@ -1,7 +1,7 @@
 # module_a/network_analyzer.py
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 import psutil
 import socket
 import ipaddress
@@ -9,7 +9,7 @@ import os
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionInfo:
     pid: int
     laddr_ip: Optional[str]
@@ -58,6 +58,46 @@ class NetworkAnalyzer:
         except ValueError:
             return None
 
+    @classmethod
+    def _conn_to_info(cls, c, pid: int, timestamp: str) -> ConnectionInfo:
+        """Convertit une sconn psutil brute en ConnectionInfo."""
+        # local addr
+        laddr_ip, laddr_port = (None, None)
+        if c.laddr:
+            try:
+                laddr_ip = c.laddr.ip if hasattr(c.laddr, 'ip') else c.laddr[0]
+                laddr_port = c.laddr.port if hasattr(c.laddr, 'port') else c.laddr[1]
+            except Exception:
+                # older psutil versions may return tuple
+                try:
+                    laddr_ip, laddr_port = c.laddr
+                except Exception:
+                    laddr_ip, laddr_port = (None, None)
+
+        # remote addr
+        raddr_ip, raddr_port = (None, None)
+        if c.raddr:
+            try:
+                raddr_ip = c.raddr.ip if hasattr(c.raddr, 'ip') else c.raddr[0]
+                raddr_port = c.raddr.port if hasattr(c.raddr, 'port') else c.raddr[1]
+            except Exception:
+                try:
+                    raddr_ip, raddr_port = c.raddr
+                except Exception:
+                    raddr_ip, raddr_port = (None, None)
+
+        return ConnectionInfo(
+            pid=pid,
+            laddr_ip=laddr_ip,
+            laddr_port=laddr_port,
+            raddr_ip=raddr_ip,
+            raddr_port=raddr_port,
+            protocol=cls._socktype_to_proto(c.type),
+            status=c.status if hasattr(c, 'status') else None,
+            timestamp=timestamp,
+            is_external=cls._is_external_ip(raddr_ip)
+        )
+
     def list_connections(self) -> List[ConnectionInfo]:
         """
         Retourne la liste des ConnectionInfo pour le PID.
@@ -66,7 +106,6 @@ class NetworkAnalyzer:
         if self.process is None:
             return []
 
-        results: List[ConnectionInfo] = []
         timestamp = datetime.now(timezone.utc).isoformat()
 
         try:
@@ -85,49 +124,26 @@ class NetworkAnalyzer:
             except Exception:
                 return []
 
-        for c in conns:
-            # local addr
-            laddr_ip, laddr_port = (None, None)
-            if c.laddr:
-                try:
-                    laddr_ip = c.laddr.ip if hasattr(c.laddr, 'ip') else c.laddr[0]
-                    laddr_port = c.laddr.port if hasattr(c.laddr, 'port') else c.laddr[1]
-                except Exception:
-                    # older psutil versions may return tuple
-                    try:
-                        laddr_ip, laddr_port = c.laddr
-                    except Exception:
-                        laddr_ip, laddr_port = (None, None)
-
-            # remote addr
-            raddr_ip, raddr_port = (None, None)
-            if c.raddr:
-                try:
-                    raddr_ip = c.raddr.ip if hasattr(c.raddr, 'ip') else c.raddr[0]
-                    raddr_port = c.raddr.port if hasattr(c.raddr, 'port') else c.raddr[1]
-                except Exception:
-                    try:
-                        raddr_ip, raddr_port = c.raddr
-                    except Exception:
-                        raddr_ip, raddr_port = (None, None)
-
-            proto = self._socktype_to_proto(c.type)
-            status = c.status if hasattr(c, 'status') else None
-            external = self._is_external_ip(raddr_ip)
-
-            info = ConnectionInfo(
-                pid=self.pid,
-                laddr_ip=laddr_ip,
-                laddr_port=laddr_port,
-                raddr_ip=raddr_ip,
-                raddr_port=raddr_port,
-                protocol=proto,
-                status=status,
-                timestamp=timestamp,
-                is_external=external
-            )
-            results.append(info)
+        return [self._conn_to_info(c, self.pid, timestamp) for c in conns]
 
+    @classmethod
+    def bulk_connections(cls, pids: Iterable[int]) -> Dict[int, List[ConnectionInfo]]:
+        """
+        Collecte les connexions de plusieurs PID en UN SEUL scan global
+        psutil.net_connections, au lieu d'un appel noyau par processus.
+        Retourne un dict pid -> liste de ConnectionInfo (vide si aucune).
+        """
+        results: Dict[int, List[ConnectionInfo]] = {pid: [] for pid in pids}
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+        try:
+            conns = psutil.net_connections(kind='inet')
+        except Exception:
+            return results
+
+        for c in conns:
+            if c.pid in results:
+                results[c.pid].append(cls._conn_to_info(c, c.pid, timestamp))
         return results
 
 
@@ -1,11 +1,12 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Iterable, Optional
+import os
 import psutil
 import time
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceUsage:
     pid: int
     cpu_percent: float
@@ -70,3 +71,94 @@ class ResourceMonitor:
 
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             return None
+
+
+class CpuSampler:
+    """
+    Échantillonneur CPU par lot pour un ensemble de processus.
+
+    Au lieu d'appeler psutil.Process.cpu_percent(interval=...) par processus
+    (un sleep bloquant à chaque appel), on lit les compteurs de ticks de
+    chaque PID une fois par tick d'analyse et on dérive le pourcentage à
+    partir d'un seul delta d'horloge murale partagé :
+
+        cpu% = 100 * delta_ticks / (delta_wall * SC_CLK_TCK)
+
+    Sur Linux les ticks viennent de /proc/<pid>/stat (utime + stime) ;
+    ailleurs on retombe sur psutil.Process.cpu_percent(None) avec des
+    objets Process réutilisés entre les appels.
+    Le premier appel retourne 0.0 pour chaque PID (pas encore de delta).
+    """
+
+    def __init__(self):
+        self._has_proc = os.path.isdir("/proc")
+        try:
+            self._clk_tck = os.sysconf("SC_CLK_TCK")
+        except (AttributeError, ValueError, OSError):
+            self._clk_tck = 100
+        self._prev_ticks: Dict[int, int] = {}
+        self._prev_wall: Optional[float] = None
+        # Fallback psutil : objets Process conservés pour garder leur état interne
+        self._procs: Dict[int, psutil.Process] = {}
+
+    @staticmethod
+    def _read_ticks(pid: int) -> int:
+        """Lit utime + stime (en ticks) depuis /proc/<pid>/stat."""
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            data = f.read()
+        # Le nom du processus (champ 2) peut contenir espaces et parenthèses :
+        # on repart de la dernière ')' pour découper les champs suivants.
+        fields = data[data.rindex(b")") + 2:].split()
+        return int(fields[11]) + int(fields[12])  # utime, stime
+
+    def sample(self, pids: Iterable[int]) -> Dict[int, float]:
+        """
+        Retourne un dict pid -> cpu% depuis le dernier appel.
+        Les PID inaccessibles ou disparus sont simplement omis.
+        """
+        if not self._has_proc:
+            return self._sample_psutil(pids)
+
+        now = time.monotonic()
+        ticks: Dict[int, int] = {}
+        for pid in pids:
+            try:
+                ticks[pid] = self._read_ticks(pid)
+            except (OSError, ValueError, IndexError):
+                continue
+
+        result: Dict[int, float] = {}
+        if self._prev_wall is not None:
+            denom = (now - self._prev_wall) * self._clk_tck
+            if denom > 0:
+                for pid, t in ticks.items():
+                    prev = self._prev_ticks.get(pid)
+                    if prev is not None and t >= prev:
+                        result[pid] = 100.0 * (t - prev) / denom
+
+        # Remplacer (et non fusionner) l'état : les PID disparus sont purgés
+        self._prev_ticks = ticks
+        self._prev_wall = now
+        return result
+
+    def _sample_psutil(self, pids: Iterable[int]) -> Dict[int, float]:
+        """Fallback non-Linux : cpu_percent(None) sur des Process réutilisés."""
+        result: Dict[int, float] = {}
+        pid_set = set(pids)
+        for pid in pid_set:
+            proc = self._procs.get(pid)
+            if proc is None:
+                try:
+                    proc = psutil.Process(pid)
+                    self._procs[pid] = proc
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            try:
+                result[pid] = proc.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                self._procs.pop(pid, None)
+        # Purge des PID disparus pour éviter une croissance sans borne
+        for pid in list(self._procs):
+            if pid not in pid_set:
+                del self._procs[pid]
+        return result
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Générateur du catalogue de ressources d'apprentissage.
+
+Lit la source de vérité learning_content/resources.json et écrit
+_resources_generated.py : un module ne contenant que des littéraux déjà
+construits, que learning_module importe tel quel. Le travail de parsing
+du catalogue est ainsi fait ici, une fois, plutôt qu'à chaque démarrage.
+
+Usage : python3 scripts/gen_resources.py
+"""
+
+import json
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED = os.path.join(ROOT, "learning_content", "resources.json")
+OUT = os.path.join(ROOT, "_resources_generated.py")
+
+# Ordre des champs attendu par LearningResource (created_at et content exclus :
+# le premier est horodaté au chargement, le second vit dans learning_content/).
+FIELDS = ("title", "category", "description", "difficulty", "duration_minutes", "tags")
+
+
+def main() -> None:
+    with open(SEED, encoding="utf-8") as f:
+        seed = json.load(f)
+
+    lines = [
+        '"""',
+        "Catalogue de ressources généré — NE PAS ÉDITER À LA MAIN.",
+        "Régénérer avec : python3 scripts/gen_resources.py",
+        '"""',
+        "",
+        "# (title, category, description, difficulty, duration_minutes, tags)",
+        "RESOURCES = {",
+    ]
+    for rid, meta in seed.items():
+        values = []
+        for field in FIELDS:
+            value = meta[field]
+            if field == "tags":
+                # frozenset littéral (trié pour un diff stable) : le record
+                # LearningResource le stocke tel quel, sans conversion.
+                values.append("frozenset(%r)" % (tuple(sorted(value)),))
+            else:
+                values.append(repr(value))
+        lines.append("    %r: (%s),"% (rid, ", ".join(values)))
+    lines.append("}")
+    lines.append("")
+
+    text = "\n".join(lines)
+    # Ne réécrire que si le contenu change : un mtime stable laisse le
+    # bytecode en cache (__pycache__) valide d'une régénération à l'autre.
+    if os.path.exists(OUT):
+        with open(OUT, encoding="utf-8") as f:
+            if f.read() == text:
+                print(f"✓ {os.path.relpath(OUT, ROOT)} déjà à jour ({len(seed)} ressources)")
+                return
+    with open(OUT, "w", encoding="utf-8") as f:
+        f.write(text)
+    print(f"✓ {os.path.relpath(OUT, ROOT)} régénéré ({len(seed)} ressources)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,32 @@
 Vue Dashboard - Affichage principal avec table de processus et infos système.
 """
 
+from jinja2 import Environment
+
+# Template des lignes de la table de processus, compilé une seule fois à
+# l'import : le rendu serveur évite de reconstruire la chaîne HTML côté JS
+# à chaque tick de rafraîchissement.
+PROC_ROWS_TEMPLATE = """\
+{% for p in procs %}
+<tr data-pid="{{ p.pid }}">
+    <td>{{ p.pid }}</td>
+    <td><strong>{{ p.name }}</strong></td>
+    <td>{{ "%.1f"|format(p.cpu_percent or 0) }}%</td>
+    <td>{{ "%.1f"|format(p.memory_mb or 0) }} MB</td>
+    <td>{{ p.network_connections or 0 }}</td>
+    <td><strong>{{ p.score or 0 }}</strong></td>
+    <td><span class="badge {{ (p.level or "SAFE")|lower }}">{{ (p.level or "SAFE")|upper }}</span>
+    {%- if p.triggered_rules %}<div class="rules">{{ p.triggered_rules|join(", ") }}</div>{% endif %}</td>
+</tr>
+{% endfor %}"""
+
+_proc_rows_tmpl = Environment(autoescape=True).from_string(PROC_ROWS_TEMPLATE)
+
+
+def render_process_rows(procs):
+    """Rend les lignes <tr> de la table de processus (fragment HTML)."""
+    return _proc_rows_tmpl.render(procs=procs)
+
 DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html>
@@ -304,16 +330,25 @@ DASHBOARD_HTML = """
 
     <script>
         let lastAlertCount = 0;
+        let sinceSeq = 0;
+        const rowByPid = new Map();
 
         function updateData() {
-            fetch("/api/analysis")
+            fetch("/api/system")
                 .then(r => r.json())
-                .then(data => {
-                    displaySystemInfo(data.system);
-                    displayProcesses(data.processes);
+                .then(sys => {
+                    displaySystemInfo(sys);
                     document.getElementById("lastUpdate").textContent = new Date().toLocaleTimeString();
                 })
                 .catch(e => console.error("Erreur:", e));
+
+            fetch(`/api/processes?since=${sinceSeq}`)
+                .then(r => r.json())
+                .then(delta => {
+                    sinceSeq = delta.seq;
+                    applyProcessDelta(delta);
+                })
+                .catch(e => console.error("Erreur processus:", e));
             
             loadAlerts();
         }
@@ -414,33 +449,55 @@ DASHBOARD_HTML = """
             document.getElementById("systemInfo").innerHTML = html;
         }
 
-        function displayProcesses(procs) {
-            if (!procs || procs.length === 0) {
-                document.getElementById("procTable").querySelector("tbody").innerHTML = '<tr><td colspan="7" class="loading">Aucun processus trouvé</td></tr>';
-                return;
+        function rowCells(p) {
+            const level = (p.level || "SAFE").toUpperCase();
+            const rules = p.triggered_rules && p.triggered_rules.length > 0
+                ? `<div class="rules">${p.triggered_rules.join(", ")}</div>`
+                : "";
+            return [
+                `${p.pid}`,
+                `<strong>${p.name}</strong>`,
+                `${(p.cpu_percent || 0).toFixed(1)}%`,
+                `${(p.memory_mb || 0).toFixed(1)} MB`,
+                `${p.network_connections || 0}`,
+                `<strong>${p.score || 0}</strong>`,
+                `<span class="badge ${level.toLowerCase()}">${level}</span>${rules}`
+            ];
+        }
+
+        // Met à jour une ligne existante cellule par cellule (ou la crée),
+        // au lieu de reconstruire tout le tbody : pas de perte de scroll,
+        // pas de re-parse HTML des lignes inchangées.
+        function upsertRow(p, tbody) {
+            const cells = rowCells(p);
+            let tr = rowByPid.get(p.pid);
+            if (!tr) {
+                tr = document.createElement("tr");
+                tr.dataset.pid = p.pid;
+                for (const c of cells) {
+                    const td = document.createElement("td");
+                    td.innerHTML = c;
+                    tr.appendChild(td);
+                }
+                tbody.appendChild(tr);
+                rowByPid.set(p.pid, tr);
+            } else {
+                const tds = tr.children;
+                cells.forEach((c, i) => {
+                    if (tds[i].innerHTML !== c) tds[i].innerHTML = c;
+                });
             }
+        }
 
-            const rows = procs.map(p => {
-                const level = (p.level || "SAFE").toUpperCase();
-                const levelBadge = `<span class="badge ${level.toLowerCase()}">${level}</span>`;
-                const rules = p.triggered_rules && p.triggered_rules.length > 0
-                    ? `<div class="rules">${p.triggered_rules.join(", ")}</div>`
-                    : "";
-
-                return `
-                    <tr>
-                        <td>${p.pid}</td>
-                        <td><strong>${p.name}</strong></td>
-                        <td>${(p.cpu_percent || 0).toFixed(1)}%</td>
-                        <td>${(p.memory_mb || 0).toFixed(1)} MB</td>
-                        <td>${p.network_connections || 0}</td>
-                        <td><strong>${p.score || 0}</strong></td>
-                        <td>${levelBadge}${rules}</td>
-                    </tr>
-                `;
-            }).join("");
-
-            document.getElementById("procTable").querySelector("tbody").innerHTML = rows;
+        function applyProcessDelta(delta) {
+            const tbody = document.getElementById("procTable").querySelector("tbody");
+            if (rowByPid.size === 0) tbody.innerHTML = "";
+            for (const p of delta.added) upsertRow(p, tbody);
+            for (const p of delta.changed) upsertRow(p, tbody);
+            for (const pid of delta.removed) {
+                const tr = rowByPid.get(pid);
+                if (tr) { tr.remove(); rowByPid.delete(pid); }
+            }
         }
 
         updateData();
@@ -3,9 +3,49 @@ Vue Infos - Documentation et informations de l'application.
 Contient la description de l'application, glossaire et meilleures pratiques.
 """
 
-from infos_view import INFOS_HTML
+from infos_view import (
+    INFOS_HTML_BYTES, INFOS_HTML_LEN, INFOS_HTML_GZIP, INFOS_HTML_ETAG,
+    INFOS_CSS_BYTES, INFOS_CSS_GZIP, INFOS_CSS_ETAG,
+)
 
 def get_infos_view():
-    """Retourne le template de la vue infos."""
-    from flask import render_template_string
-    return render_template_string(INFOS_HTML)
+    """Retourne la page infos (statique, pré-compressée à l'import du module)."""
+    from flask import request, Response
+
+    headers = {
+        "ETag": INFOS_HTML_ETAG,
+        "Cache-Control": "public, max-age=3600",
+        "Vary": "Accept-Encoding",
+    }
+
+    if request.headers.get("If-None-Match") == INFOS_HTML_ETAG:
+        return Response(status=304, headers=headers)
+
+    if "gzip" in request.accept_encodings:
+        headers["Content-Encoding"] = "gzip"
+        return Response(INFOS_HTML_GZIP, mimetype="text/html", headers=headers)
+
+    # Longueur pré-calculée à l'import : pas de len() ni d'encode par requête
+    headers["Content-Length"] = INFOS_HTML_LEN
+    return Response(INFOS_HTML_BYTES, mimetype="text/html", headers=headers)
+
+
+def get_infos_css_view():
+    """Retourne la feuille de style de la page infos (pré-compressée)."""
+    from flask import request, Response
+
+    headers = {
+        "ETag": INFOS_CSS_ETAG,
+        # Asset immuable : le navigateur peut le garder un an sans revalider
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "Vary": "Accept-Encoding",
+    }
+
+    if request.headers.get("If-None-Match") == INFOS_CSS_ETAG:
+        return Response(status=304, headers=headers)
+
+    if "gzip" in request.accept_encodings:
+        headers["Content-Encoding"] = "gzip"
+        return Response(INFOS_CSS_GZIP, mimetype="text/css", headers=headers)
+
+    return Response(INFOS_CSS_BYTES, mimetype="text/css", headers=headers)
@@ -82,6 +82,8 @@ LEARNING_HTML = """<!DOCTYPE html>
         .modal-body h3 { color: #00ff88; margin-top: 15px; margin-bottom: 8px; }
         .modal-body ul { margin-left: 20px; margin-bottom: 10px; }
         .modal-body li { margin-bottom: 6px; }
+        .lesson-tbl { border-collapse: collapse; margin-bottom: 10px; }
+        .lesson-tbl td, .lesson-tbl th { padding: 8px; border: 1px solid #888; }
         footer { background: rgba(0,0,0,0.18); border-top:1px solid rgba(0,255,136,0.06); padding:12px 20px; color:#9fb0c8; text-align:center; font-size:0.9em; }
         footer a { color:#7ee787; text-decoration:none; }
     </style>